@@ -22,7 +22,7 @@
 
 from collections import defaultdict
 import concurrent.futures
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 from ansys.grantami.serverapi_openapi import api, models  # type: ignore[import]
 from ansys.openapi.common import (  # type: ignore[import]
@@ -45,7 +45,18 @@ GRANTA_APPLICATION_NAME_HEADER = "PyGranta RecordLists"
 
 MINIMUM_GRANTA_MI_VERSION = (25, 2)
 
-_ArgNotProvided = "_ArgNotProvided"
+
+class _ArgNotProvidedType:
+    """Sentinel type used to distinguish omitted arguments from arguments explicitly set to None."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Printable representation of the object."""
+        return "_ArgNotProvided"
+
+
+_ArgNotProvided: Any = _ArgNotProvidedType()
 
 
 def _get_mi_server_version(client: ApiClient) -> Tuple[int, ...]:
@@ -279,7 +290,7 @@ class RecordListsApiClient(ApiClient):  # type: ignore[misc]
         response_items = self.list_item_api.add_items_to_list(
             list_identifier=record_list.identifier,
             body=models.GsaCreateRecordListItemsInfo(
-                items=[item._to_create_list_item_model() for item in items]
+                items=RecordListItem._to_create_list_item_models(items)
             ),
         )
         return [RecordListItem._from_model(item) for item in response_items.items]
@@ -309,7 +320,7 @@ class RecordListsApiClient(ApiClient):  # type: ignore[misc]
         response_items = self.list_item_api.remove_items_from_list(
             list_identifier=record_list.identifier,
             body=models.GsaDeleteRecordListItems(
-                items=[item._to_delete_list_item_model() for item in items]
+                items=RecordListItem._to_delete_list_item_models(items)
             ),
         )
         return [RecordListItem._from_model(item) for item in response_items.items]
@@ -346,7 +357,7 @@ class RecordListsApiClient(ApiClient):  # type: ignore[misc]
         logger.info(f"Creating new list {name} with {items_string} with connection {self}")
         if items is not None:
             items = models.GsaCreateRecordListItemsInfo(
-                items=[list_item._to_create_list_item_model() for list_item in items]
+                items=RecordListItem._to_create_list_item_models(items)
             )
         body = models.GsaCreateRecordList(
             name=name, description=description, notes=notes, items=items if items else Unset
@@ -399,7 +410,7 @@ class RecordListsApiClient(ApiClient):  # type: ignore[misc]
             Updated representation of the record list.
         """
         logger.info(f"Updating list {record_list} with connection {self}")
-        if name == _ArgNotProvided and description == _ArgNotProvided and notes == _ArgNotProvided:
+        if name is _ArgNotProvided and description is _ArgNotProvided and notes is _ArgNotProvided:
             raise ValueError(
                 f"Update must include at least one property to update. "
                 f"Supported properties are 'name', 'description', and 'notes'."
@@ -409,11 +420,11 @@ class RecordListsApiClient(ApiClient):  # type: ignore[misc]
             raise ValueError(f"If provided, argument 'name' cannot be None.")
 
         body = models.GsaUpdateRecordListProperties()
-        if name != _ArgNotProvided:
+        if name is not _ArgNotProvided:
             body.name = name
-        if description != _ArgNotProvided:
+        if description is not _ArgNotProvided:
             body.description = description
-        if notes != _ArgNotProvided:
+        if notes is not _ArgNotProvided:
             body.notes = notes
         updated_resource = self.list_management_api.update_list(
             list_identifier=record_list.identifier, body=body
@@ -24,13 +24,21 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union
+import functools
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, Union, overload
 
 from ansys.grantami.serverapi_openapi import models  # type: ignore[import]
 from ansys.openapi.common import Unset  # type: ignore[import]
 
 from ._logger import logger
 
+# Auto-generated models used to serialize individual record list items. Bound once at import time,
+# since they are instantiated once per item in bulk operations.
+_CreateListItemModel = models.GsaCreateListItem
+_DeleteListItemModel = models.GsaDeleteRecordListItem
+_ListItemRecordReferenceModel = models.GsaListItemRecordReference
+
 
 class RecordList:
     """
@@ -39,6 +47,24 @@ class RecordList:
     Read-only - do not directly instantiate or modify instances of this class.
     """
 
+    __slots__ = (
+        "_identifier",
+        "_name",
+        "_created_timestamp",
+        "_created_user",
+        "_published",
+        "_is_revision",
+        "_awaiting_approval",
+        "_internal_use",
+        "_description",
+        "_notes",
+        "_last_modified_timestamp",
+        "_last_modified_user",
+        "_published_timestamp",
+        "_published_user",
+        "_parent_record_list_identifier",
+    )
+
     def __init__(
         self,
         identifier: str,
@@ -180,7 +206,8 @@ class RecordList:
     ) -> "RecordList":
         """Instantiate from a model defined in the auto-generated client code."""
         logger.debug("Deserializing RecordList from API response")
-        logger.debug(model.to_str())
+        # API models are only rendered to a string if the record is actually emitted.
+        logger.debug("%s", model)
         instance = cls(
             name=model.name,
             identifier=model.identifier,
@@ -195,9 +222,7 @@ class RecordList:
             last_modified_timestamp=model.last_modified_timestamp,
             last_modified_user=UserOrGroup._from_model(model.last_modified_user),
             published_timestamp=model.published_timestamp,
-            published_user=(
-                UserOrGroup._from_model(model.published_user) if model.published_user else None
-            ),
+            published_user=UserOrGroup._from_model(model.published_user),
             parent_record_list_identifier=model.parent_record_list_identifier,
         )
         return instance
@@ -231,6 +256,15 @@ class RecordListItem:
        available version of the record.
     """
 
+    __slots__ = (
+        "_database_guid",
+        "_table_guid",
+        "_record_history_guid",
+        "_record_version",
+        "_record_guid",
+        "_key",
+    )
+
     def __init__(
         self,
         database_guid: str,
@@ -243,6 +277,12 @@ class RecordListItem:
         self._record_history_guid: str = record_history_guid
         self._record_version: Optional[int] = record_version
         self._record_guid: Optional[str] = None
+        self._key: Tuple[str, str, str, Optional[int]] = (
+            database_guid,
+            table_guid,
+            record_history_guid,
+            record_version,
+        )
 
     @property
     def database_guid(self) -> str:
@@ -279,21 +319,22 @@ class RecordListItem:
         """Evaluate equality by checking equality of GUIDs and record version."""
         if not isinstance(other, RecordListItem):
             return False
-        return (
-            self.database_guid == other.database_guid
-            and self.table_guid == other.table_guid
-            and self.record_history_guid == other.record_history_guid
-            and self.record_version == other.record_version
-        )
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        """Compute a hash consistent with equality, based on GUIDs and record version."""
+        return hash(self._key)
 
     @classmethod
     def _from_model(cls, model: models.GsaListItem) -> "RecordListItem":
         """Instantiate from a model defined in the auto-generated client code."""
         logger.debug("Deserializing RecordListItem from API response")
-        logger.debug(model.to_str())
+        logger.debug("%s", model)
+        # Items in a response typically share a handful of database and table GUIDs. Interning
+        # them stores one string per distinct GUID instead of one per item.
         instance = cls(
-            database_guid=model.database_guid,
-            table_guid=model.table_guid,
+            database_guid=sys.intern(model.database_guid),
+            table_guid=sys.intern(model.table_guid),
             record_history_guid=model.record_history_guid,
             record_version=model.record_version if model.record_version else None,
         )
@@ -301,47 +342,67 @@ class RecordListItem:
 
         return instance
 
-    def _to_create_list_item_model(self) -> models.GsaCreateListItem:
-        """Generate the Create List Item DTO for use with the auto-generated client code."""
-        logger.debug("Serializing RecordListItem to GsaCreateListItem API model")
-        model = models.GsaCreateListItem(
-            database_guid=self.database_guid,
-            table_guid=self.table_guid,
-            record_history_guid=self.record_history_guid,
-            record_version=self.record_version,
-        )
-        logger.debug(model.to_str())
-        return model
+    @staticmethod
+    def _to_create_list_item_models(
+        items: Iterable["RecordListItem"],
+    ) -> List[models.GsaCreateListItem]:
+        """Generate Create List Item DTOs for use with the auto-generated client code.
 
-    def _to_delete_list_item_model(self) -> models.GsaDeleteRecordListItem:
-        """Generate the Delete List Item DTO for use with the auto-generated client code."""
-        logger.debug("Serializing RecordListItem to GsaDeleteRecordListItem API model")
-        model = models.GsaDeleteRecordListItem(
-            database_guid=self.database_guid,
-            record_history_guid=self.record_history_guid,
-            record_version=self.record_version,
+        A single summary message is logged instead of every DTO.
+        """
+        create_list_item_model = _CreateListItemModel
+        item_models = [
+            create_list_item_model(
+                database_guid=item._database_guid,
+                table_guid=item._table_guid,
+                record_history_guid=item._record_history_guid,
+                record_version=item._record_version,
+            )
+            for item in items
+        ]
+        logger.debug(f"Serialized {len(item_models)} RecordListItems to GsaCreateListItem models")
+        return item_models
+
+    @staticmethod
+    def _to_delete_list_item_models(
+        items: Iterable["RecordListItem"],
+    ) -> List[models.GsaDeleteRecordListItem]:
+        """Generate Delete List Item DTOs for use with the auto-generated client code.
+
+        A single summary message is logged instead of every DTO.
+        """
+        delete_list_item_model = _DeleteListItemModel
+        item_models = [
+            delete_list_item_model(
+                database_guid=item._database_guid,
+                record_history_guid=item._record_history_guid,
+                record_version=item._record_version,
+            )
+            for item in items
+        ]
+        logger.debug(
+            f"Serialized {len(item_models)} RecordListItems to GsaDeleteRecordListItem models"
         )
-        logger.debug(model.to_str())
-        return model
+        return item_models
 
     def _to_contains_search_item_model(self) -> models.GsaListItemRecordReference:
         logger.debug("Serializing RecordListItem to GsaListItemRecordReference API model")
-        model = models.GsaListItemRecordReference(
-            database_guid=self.database_guid,
-            record_history_guid=self.record_history_guid,
-            record_version=self.record_version,
+        model = _ListItemRecordReferenceModel(
+            database_guid=self._database_guid,
+            record_history_guid=self._record_history_guid,
+            record_version=self._record_version,
         )
-        logger.debug(model.to_str())
+        logger.debug("%s", model)
         return model
 
     def __repr__(self) -> str:
         """Printable representation of the object."""
         properties = {
-            "database_guid": f"'{self.database_guid}'",
-            "record_history_guid": f"'{self.record_history_guid}'",
+            "database_guid": f"'{self._database_guid}'",
+            "record_history_guid": f"'{self._record_history_guid}'",
         }
-        if self.record_version is not None:
-            properties["record_version"] = str(self.record_version)
+        if self._record_version is not None:
+            properties["record_version"] = str(self._record_version)
         formatted_properties = ", ".join(f"{name}={value}" for name, value in properties.items())
         return f"<{self.__class__.__name__}({formatted_properties})>"
 
@@ -352,10 +413,17 @@ class UserOrGroup:
     Read-only - do not directly instantiate or modify instances of this class.
     """
 
-    def __init__(self) -> None:
-        self._identifier: Optional[str] = None
-        self._display_name: Optional[str] = None
-        self._name: Optional[str] = None
+    __slots__ = ("_identifier", "_display_name", "_name")
+
+    def __init__(
+        self,
+        identifier: Optional[str] = None,
+        display_name: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self._identifier: Optional[str] = identifier
+        self._display_name: Optional[str] = display_name
+        self._name: Optional[str] = name
 
     @property
     def identifier(self) -> Optional[str]:
@@ -372,26 +440,53 @@ class UserOrGroup:
         """Read-only name of the user or group."""
         return self._name
 
+    @overload
     @classmethod
-    def _from_model(cls, dto_user: models.GsaListsUserOrGroup) -> "UserOrGroup":
-        """Instantiate from a model defined in the auto-generated client code."""
+    def _from_model(cls, dto_user: None) -> None: ...
+
+    @overload
+    @classmethod
+    def _from_model(cls, dto_user: models.GsaListsUserOrGroup) -> "UserOrGroup": ...
+
+    @classmethod
+    def _from_model(cls, dto_user: Optional[models.GsaListsUserOrGroup]) -> Optional["UserOrGroup"]:
+        """Instantiate from a model defined in the auto-generated client code.
+
+        Returns ``None`` if no model is provided, for example for a list that has not been
+        published.
+        """
+        if not dto_user:
+            return None
         logger.debug("Deserializing UserOrGroup from API response")
-        logger.debug(dto_user.to_str())
-        user: UserOrGroup = UserOrGroup()
-        user._identifier = dto_user.identifier
-        user._display_name = dto_user.display_name
-        user._name = dto_user.name
-        return user
+        logger.debug("%s", dto_user)
+        return _get_user_or_group(dto_user.identifier, dto_user.display_name, dto_user.name)
 
     def __repr__(self) -> str:
         """Printable representation of the object."""
-        return f"<{self.__class__.__name__} display_name: {self.display_name}>"
+        return f"<{self.__class__.__name__} display_name: {self._display_name}>"
 
     def __eq__(self, other: object) -> bool:
         """Evaluate equality by checking equality of identifiers."""
         if not isinstance(other, UserOrGroup):
             return False
-        return self.identifier == other.identifier
+        return self._identifier == other._identifier
+
+    def __hash__(self) -> int:
+        """Compute a hash consistent with equality, based on the identifier."""
+        return hash(self._identifier)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_user_or_group(
+    identifier: Optional[str], display_name: Optional[str], name: Optional[str]
+) -> UserOrGroup:
+    """Get a :class:`UserOrGroup` instance with the provided properties.
+
+    The same few users typically appear many times in a single API response, for example as the
+    creator and last modifier of every record list. Instances are read-only, so they are cached and
+    shared instead of being re-created for every occurrence.
+    """
+    return UserOrGroup(identifier, display_name, name)
 
 
 class SearchCriterion:
@@ -577,9 +672,7 @@ class SearchCriterion:
     def _to_model(self) -> models.GsaRecordListSearchCriterion:
         """Generate the DTO for use with the auto-generated client code."""
         logger.debug("Serializing SearchCriterion to API model")
-        user_role = (
-            models.GsaUserRole(self.user_role.value) if self.user_role is not None else Unset
-        )
+        user_role = _USER_ROLE_TO_MODEL[self.user_role] if self.user_role is not None else Unset
         record_references = (
             [RecordListItem._to_contains_search_item_model(item) for item in self.contains_records]
             if self.contains_records is not None
@@ -598,7 +691,7 @@ class SearchCriterion:
             contains_records=record_references,
             user_can_add_or_remove_items=self.user_can_add_or_remove_items,
         )
-        logger.debug(model.to_str())
+        logger.debug("%s", model)
         return model
 
     def __repr__(self) -> str:
@@ -694,7 +787,7 @@ class BooleanCriterion:
                 else None
             ),
         )
-        logger.debug(model.to_str())
+        logger.debug("%s", model)
         return model
 
     def __repr__(self) -> str:
@@ -718,12 +811,21 @@ class UserRole(str, Enum):
     PUBLISHER = models.GsaUserRole.PUBLISHER.value
 
 
+# Mapping from UserRole members to the equivalent members of the auto-generated enum, built once
+# at import time.
+_USER_ROLE_TO_MODEL: Dict[UserRole, models.GsaUserRole] = {
+    role: models.GsaUserRole(role.value) for role in UserRole
+}
+
+
 class SearchResult:
     """Describes the result of a search.
 
     Read-only - do not directly instantiate or modify instances of this class.
     """
 
+    __slots__ = ("_record_list", "_items")
+
     def __init__(self, record_list: RecordList, items: Optional[List[RecordListItem]]):
         self._record_list = record_list
         self._items = items
@@ -745,7 +847,7 @@ class SearchResult:
 
     def __repr__(self) -> str:
         """Printable representation of the object."""
-        return f"<{self.__class__.__name__} name: {self.record_list.name}>"
+        return f"<{self.__class__.__name__} name: {self._record_list.name}>"
 
     @classmethod
     def _from_model(
@@ -765,7 +867,7 @@ class SearchResult:
         """
         logger.debug("Deserializing SearchResult from API response")
         logger.debug(f"List items were{' ' if includes_items else ' not '}requested")
-        logger.debug(model.to_str())
+        logger.debug("%s", model)
         # Set items to None if they have not been requested to allow distinction between list
         # without items and list whose items have not been requested. On the DTO object, both are
         # represented by an empty list.
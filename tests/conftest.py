@@ -20,14 +20,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import json
+import os
 import uuid
 
 import pytest
 import requests_mock
 
 from ansys.grantami.recordlists import Connection, RecordListItem
-from inputs.examples import examples_as_strings
+from inputs.examples import examples_as_dicts
 
 MI_VERSION_RESPONSE = {
     "binary_compatibility_version": "99.99.0.0",
@@ -57,8 +57,7 @@ def mock_client(api_url, mocker):
 
 @pytest.fixture
 def mock_response(request):
-    response_text = examples_as_strings.get(request.node.name)
-    return json.loads(response_text)
+    return examples_as_dicts.get(request.node.name)
 
 
 @pytest.fixture(scope="session")
@@ -74,13 +73,18 @@ def unresolvable_item():
 @pytest.fixture(scope="session")
 def many_unresolvable_items():
     # GUIDs need only have the correct format for record lists test to pass.
-    results = []
-    for i in range(5000):
-        results.append(
-            RecordListItem(
-                database_guid="e595fe23-b450-4d18-8c08-4a0f378ef095",
-                table_guid=str(uuid.uuid4()),
-                record_history_guid=str(uuid.uuid4()),
-            )
+    # Random bytes for all GUIDs are read in a single call rather than one call per GUID.
+    item_count = 5000
+    random_bytes = os.urandom(16 * 2 * item_count)
+    guids = [
+        str(uuid.UUID(bytes=random_bytes[offset : offset + 16], version=4))
+        for offset in range(0, len(random_bytes), 16)
+    ]
+    return [
+        RecordListItem(
+            database_guid="e595fe23-b450-4d18-8c08-4a0f378ef095",
+            table_guid=table_guid,
+            record_history_guid=record_history_guid,
         )
-    return results
+        for table_guid, record_history_guid in zip(guids[0::2], guids[1::2])
+    ]
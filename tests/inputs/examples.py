@@ -20,7 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
+
 examples_as_strings = {
     "test_get_all_lists": r"""{"lists":[{"identifier": "bffba6ef-b85a-4b26-932b-00875b74ca2e", "metadata": {}, "createdTimestamp": "2023-01-12T11:17:46.88+00:00", "createdUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "lastModifiedTimestamp": "2023-02-02T13:05:54.717+00:00", "lastModifiedUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "publishedTimestamp": "2023-01-27T14:36:29.967+00:00", "publishedUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "isRevision": false, "name": "Test List", "description": "Test List - Description", "notes": "Test List - Notes", "published": false, "awaitingApproval": false, "internalUse": false}, {"identifier": "5ca1d3f6-9afd-427c-ad09-03e2b71bfd75", "metadata": {}, "createdTimestamp": "2023-02-03T12:31:17.507+00:00", "createdUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "lastModifiedTimestamp": "2023-02-03T12:31:17.507+00:00", "lastModifiedUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "isRevision": false, "name": "CreateTest", "published": false, "awaitingApproval": false, "internalUse": false}]}""",  # noqa: E501
     "test_get_single_list": r"""{"identifier": "bffba6ef-b85a-4b26-932b-00875b74ca2e", "metadata": {}, "createdTimestamp": "2023-01-12T11:17:46.88+00:00", "createdUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "lastModifiedTimestamp": "2023-02-02T13:05:54.717+00:00", "lastModifiedUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "publishedTimestamp": "2023-01-27T14:36:29.967+00:00", "publishedUser": {"identifier": "7134b26c-42df-4e86-b801-317f05b8c399", "displayName": "DOMAIN\\mi_user", "name": "DOMAIN\\mi_user"}, "isRevision": false, "name": "Test List", "description": "Test List - Description", "notes": "Test List - Notes", "published": false, "awaitingApproval": false, "internalUse": false}""",  # noqa: E501
 }
+
+examples_as_dicts = {name: json.loads(text) for name, text in examples_as_strings.items()}
@@ -20,7 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ansys.grantami.serverapi_openapi.api import (
     RecordsRecordHistoriesApi,
@@ -30,9 +32,11 @@ from ansys.grantami.serverapi_openapi.api import (
     SearchApi,
 )
 from ansys.grantami.serverapi_openapi.models import (
+    GsaBooleanCriterion,
     GsaCreateRecordHistory,
     GsaRecordPropertyCriterion,
     GsaRecordType,
+    GsaRecordVersion,
     GsaSearchableRecordProperty,
     GsaSearchRequest,
     GsaShortTextDatumCriterion,
@@ -43,6 +47,10 @@ from ansys.openapi.common import ApiClient
 DB_KEY = "MI_Training"
 TABLE_NAME = "Design Data"
 
+# Record history GUIDs in DB_KEY, keyed by record name. Populated by prefetch_histories and
+# RecordCreator, and used by RecordCreator to avoid searching for each history separately.
+_history_guids: Dict[str, str] = {}
+
 
 class VersionControlError(Exception):
     def __init__(
@@ -53,12 +61,91 @@ class VersionControlError(Exception):
         current_version_number,
         current_version_state,
     ):
-        message = (
+        super().__init__(
+            history_name,
+            required_version_number,
+            required_version_state,
+            current_version_number,
+            current_version_state,
+        )
+        self.history_name = history_name
+        self.required_version_number = required_version_number
+        self.required_version_state = required_version_state
+        self.current_version_number = current_version_number
+        self.current_version_state = current_version_state
+
+    def __str__(self) -> str:
+        # The message is only formatted if the exception is displayed.
+        return (
             f"Cannot satisfy required record version for this record history. "
-            f"'{history_name}' is currently v{current_version_number}: {current_version_state}, but "
-            f"v{required_version_number}: {required_version_state} was requested."
+            f"'{self.history_name}' is currently v{self.current_version_number}: "
+            f"{self.current_version_state}, but v{self.required_version_number}: "
+            f"{self.required_version_state} was requested."
         )
-        super().__init__(message)
+
+
+@functools.lru_cache
+def get_table_guids(admin_client: ApiClient, database_key: str) -> Dict[str, str]:
+    """Get the GUIDs of all tables in a database, indexed by table name.
+
+    Schemas do not change during a test session, so results are cached per client.
+    """
+    tables_api = SchemaTablesApi(admin_client)
+    all_tables = tables_api.get_tables(database_key=database_key)
+    return {table.name: table.guid for table in all_tables.tables}
+
+
+@functools.lru_cache
+def get_database_guids(admin_client: ApiClient) -> Dict[str, str]:
+    """Get the GUIDs of all databases, indexed by database key.
+
+    Schemas do not change during a test session, so results are cached per client.
+    """
+    schema_api = SchemaDatabasesApi(admin_client)
+    dbs = schema_api.get_all_databases()
+    return {db.key: db.guid for db in dbs.databases}
+
+
+def _record_name_criterion(history_name: str) -> GsaRecordPropertyCriterion:
+    return GsaRecordPropertyCriterion(
+        _property=GsaSearchableRecordProperty.RECORDNAME,
+        inner_criterion=GsaShortTextDatumCriterion(
+            value=history_name,
+        ),
+    )
+
+
+def prefetch_histories(admin_client: ApiClient, history_names: Iterable[str]) -> None:
+    """Find the record histories with the specified names in a single search.
+
+    Histories which are found exactly once are cached for use by :class:`RecordCreator`. Other
+    histories are searched for, or created, individually by :class:`RecordCreator`.
+
+    Parameters
+    ----------
+    admin_client : ApiClient
+        Client to use for the Server API search
+    history_names : Iterable[str]
+        Names of the records to find
+    """
+    history_names = list(history_names)
+    search_api = SearchApi(admin_client)
+    search_body = GsaSearchRequest(
+        criterion=GsaBooleanCriterion(
+            any=[_record_name_criterion(history_name) for history_name in history_names],
+        )
+    )
+    search_results = search_api.database_search(
+        database_key=DB_KEY,
+        body=search_body,
+    )
+    guids_by_name: Dict[str, list] = {}
+    for result in search_results.results:
+        guids_by_name.setdefault(result.record_name, []).append(result.record_history_guid)
+    for history_name in history_names:
+        history_guids = guids_by_name.get(history_name, [])
+        if len(history_guids) == 1:
+            _history_guids[history_name] = history_guids[0]
 
 
 class RecordCreator:
@@ -82,6 +169,38 @@ class RecordCreator:
         Name of the record to create/access
     """
 
+    # Methods to call, in order, to obtain a required version from the latest version of the
+    # history. Keys are (required state, required version, latest state, latest version), where a
+    # latest version of None matches any version number.
+    _TRANSITIONS = {
+        # Release unreleased v1
+        (GsaVersionState.RELEASED, 1, GsaVersionState.UNRELEASED, 1): ("_release",),
+        # Release unreleased v1 and create new unreleased v2
+        (GsaVersionState.UNRELEASED, 2, GsaVersionState.UNRELEASED, 1): (
+            "_release",
+            "_create_new_unreleased",
+        ),
+        # Create new unreleased v2 from released v1
+        (GsaVersionState.UNRELEASED, 2, GsaVersionState.RELEASED, 1): ("_create_new_unreleased",),
+        # Release unreleased v2, which supersedes v1
+        (GsaVersionState.SUPERSEDED, 1, GsaVersionState.UNRELEASED, 2): ("_release",),
+        # Release unreleased v1, then create a new version and release that
+        (GsaVersionState.SUPERSEDED, 1, GsaVersionState.UNRELEASED, 1): (
+            "_release",
+            "_create_new_unreleased",
+            "_release",
+        ),
+        # Create a new version from released or withdrawn v1 and release it
+        (GsaVersionState.SUPERSEDED, 1, GsaVersionState.RELEASED, None): (
+            "_create_new_unreleased",
+            "_release",
+        ),
+        (GsaVersionState.SUPERSEDED, 1, GsaVersionState.WITHDRAWN, None): (
+            "_create_new_unreleased",
+            "_release",
+        ),
+    }
+
     def __init__(
         self,
         admin_client: ApiClient,
@@ -94,17 +213,14 @@ class RecordCreator:
         self.table_name = table_name
         self.history_name = history_name
 
-        tables_api = SchemaTablesApi(self.admin_client)
-        all_tables = tables_api.get_tables(database_key=self.database_key)
-        self._table_guid = next(
-            table.guid for table in all_tables.tables if table.name == self.table_name
-        )
-
-        schema_api = SchemaDatabasesApi(self.admin_client)
-        dbs = schema_api.get_all_databases()
-        self._database_guid = next(db.guid for db in dbs.databases if db.key == database_key)
+        self._histories_api = RecordsRecordHistoriesApi(self.admin_client)
+        self._versions_api = RecordsRecordVersionsApi(self.admin_client)
+        self._search_api = SearchApi(self.admin_client)
 
+        self._table_guid = None
+        self._database_guid = None
         self._history_guid = None
+        self._version_guids = None
         self._latest_state = None
         self._latest_version_guid = None
         self._latest_version = None
@@ -117,8 +233,11 @@ class RecordCreator:
         -------
         str
         """
+        if not self._history_guid:
+            self._history_guid = _history_guids.get(self.history_name)
         if not self._history_guid:
             self._history_guid = self._get_or_create_history()
+            _history_guids[self.history_name] = self._history_guid
         return self._history_guid
 
     @property
@@ -130,7 +249,9 @@ class RecordCreator:
         str
         """
         if not self._table_guid:
-            raise ValueError
+            self._table_guid = get_table_guids(self.admin_client, self.database_key)[
+                self.table_name
+            ]
         return self._table_guid
 
     @property
@@ -142,7 +263,7 @@ class RecordCreator:
         str
         """
         if not self._database_guid:
-            raise ValueError
+            self._database_guid = get_database_guids(self.admin_client)[self.database_key]
         return self._database_guid
 
     @property
@@ -163,17 +284,43 @@ class RecordCreator:
             self._get_latest_version_info()
         return self._latest_version_guid
 
-    def _get_latest_version_info(self) -> None:
-        """Update this object with information about the latest version of a specified record history."""
+    def _get_latest_version_info(self) -> Dict[Tuple[GsaVersionState, int], str]:
+        """Update this object with information about the latest version of a specified record history.
+
+        The record versions of the history are cached until the history is modified by this object.
 
-        history_api = RecordsRecordHistoriesApi(self.admin_client)
-        history_details = history_api.get_record_history(
+        Returns
+        -------
+        dict[tuple[GsaVersionState, int], str]
+            GUIDs of all versions of the record history, indexed by version state and number
+        """
+
+        history_details = self._histories_api.get_record_history(
             database_key=DB_KEY,
             record_history_guid=self.history_guid,
         )
-        self._latest_state = history_details.record_versions[-1].version_state
-        self._latest_version = history_details.record_versions[-1].version_number
-        self._latest_version_guid = history_details.record_versions[-1].guid
+        record_versions = history_details.record_versions
+        self._version_guids = {
+            (version.version_state, version.version_number): version.guid
+            for version in record_versions
+        }
+        latest_version = record_versions[-1]
+        self._latest_state = latest_version.version_state
+        self._latest_version = latest_version.version_number
+        self._latest_version_guid = latest_version.guid
+        return self._version_guids
+
+    def _update_latest_version_info(self, record_version: GsaRecordVersion) -> None:
+        """Update this object with a record version returned by an operation which modified the
+        record history.
+
+        The cached record versions of the history are discarded, since the states of earlier
+        versions may also have changed.
+        """
+        self._version_guids = None
+        self._latest_state = record_version.version_state
+        self._latest_version = record_version.version_number
+        self._latest_version_guid = record_version.guid
 
     def _get_or_create_history(self) -> str:
         """Get the GUID for the history with the specified name.
@@ -187,16 +334,8 @@ class RecordCreator:
         """
 
         # First check if we can find the record
-        search_api = SearchApi(self.admin_client)
-        search_body = GsaSearchRequest(
-            criterion=GsaRecordPropertyCriterion(
-                _property=GsaSearchableRecordProperty.RECORDNAME,
-                inner_criterion=GsaShortTextDatumCriterion(
-                    value=self.history_name,
-                ),
-            )
-        )
-        search_results = search_api.database_search(
+        search_body = GsaSearchRequest(criterion=_record_name_criterion(self.history_name))
+        search_results = self._search_api.database_search(
             database_key=DB_KEY,
             body=search_body,
         )
@@ -210,10 +349,9 @@ class RecordCreator:
                 f"{record_count}, but expected 0 or 1. Cannot continue."
             )
 
-        history_api = RecordsRecordHistoriesApi(self.admin_client)
-        response = history_api.create_record_history(
+        response = self._histories_api.create_record_history(
             database_key=DB_KEY,
-            table_guid=self._table_guid,
+            table_guid=self.table_guid,
             body=GsaCreateRecordHistory(name=self.history_name, record_type=GsaRecordType.RECORD),
         )
         return response.guid
@@ -238,53 +376,26 @@ class RecordCreator:
         if version_guid:
             return version_guid
 
-        # We need a released v1 record
-        if required_state == GsaVersionState.RELEASED and required_version == 1:
-            if self.latest_state == GsaVersionState.UNRELEASED and self.latest_version == 1:
-                self._release()
-                return self.latest_version_guid
-
-        # We need an unreleased version 2 record
-        if required_state == GsaVersionState.UNRELEASED and required_version == 2:
-            if self.latest_version == 1 and self.latest_state == GsaVersionState.UNRELEASED:
-                # Release v1 and create new unreleased v2
-                self._release()
-                self._create_new_unreleased()
-            elif self.latest_version == 1 and self.latest_state == GsaVersionState.RELEASED:
-                # Just create new unreleased v2
-                self._create_new_unreleased()
-            return self._get_version_guid_in_state(required_state, required_version)
-
-        # We need a superseded version 1 record
-        if required_state == GsaVersionState.SUPERSEDED and required_version == 1:
-            if self.latest_state == GsaVersionState.UNRELEASED and self.latest_version == 2:
-                # If latest version is unreleased v2 is unreleased, release it.
-                self._release()
-                # Re-fetch the information for the newly-superseded record
-            elif self.latest_state == GsaVersionState.UNRELEASED and self.latest_version == 1:
-                # If v1 is unreleased, we need to release it, then create a new version,
-                # and then release that
-                self._release()
-                self._create_new_unreleased()
-                self._release()
-            elif self.latest_state in [
-                GsaVersionState.RELEASED,
-                GsaVersionState.WITHDRAWN,
-            ]:
-                # If v1 is released or withdrawn, then create a new version and then release it
-                self._create_new_unreleased()
-                self._release()
-            return self._get_version_guid_in_state(required_state, required_version)
-
-        # If we end up here, either the history was in a state that could not produce the required
-        # version, or the specific scenario is not implemented.
-        raise VersionControlError(
-            history_name=self.history_name,
-            required_version_number=required_version,
-            required_version_state=required_state,
-            current_version_number=self.latest_version,
-            current_version_state=self.latest_state,
-        )
+        latest_state, latest_version = self.latest_state, self.latest_version
+        steps = self._TRANSITIONS.get(
+            (required_state, required_version, latest_state, latest_version)
+        ) or self._TRANSITIONS.get((required_state, required_version, latest_state, None))
+        if steps is None:
+            # Either the history is in a state that cannot produce the required version, or the
+            # specific scenario is not implemented.
+            raise VersionControlError(
+                history_name=self.history_name,
+                required_version_number=required_version,
+                required_version_state=required_state,
+                current_version_number=latest_version,
+                current_version_state=latest_state,
+            )
+
+        for step in steps:
+            getattr(self, step)()
+        if self.latest_state == required_state and self.latest_version == required_version:
+            return self.latest_version_guid
+        return self._get_version_guid_in_state(required_state, required_version)
 
     def _get_version_guid_in_state(
         self, version_state: GsaVersionState, version_number: int
@@ -304,14 +415,10 @@ class RecordCreator:
             The record version guid, or None if one could not be found
 
         """
-        history_api = RecordsRecordHistoriesApi(self.admin_client)
-        history_details = history_api.get_record_history(
-            database_key=DB_KEY,
-            record_history_guid=self.history_guid,
-        )
-        for version in history_details.record_versions:
-            if version.version_state == version_state and version_number == version.version_number:
-                return version.guid
+        version_guids = self._version_guids
+        if version_guids is None:
+            version_guids = self._get_latest_version_info()
+        return version_guids.get((version_state, version_number))
 
     def _release(self) -> None:
         """Release the latest version guid.
@@ -321,17 +428,16 @@ class RecordCreator:
         RuntimeError
             If an error occurs when releasing the record.
         """
-        versions_api = RecordsRecordVersionsApi(self.admin_client)
-        result = versions_api.release_record_version(
+        result = self._versions_api.release_record_version(
             database_key=DB_KEY,
-            table_guid=self._table_guid,
+            table_guid=self.table_guid,
             record_history_guid=self.history_guid,
             record_version_guid=self.latest_version_guid,
         )
-        try:
-            raise RuntimeError(result.errors)
-        except AttributeError:
-            pass
+        errors = getattr(result, "errors", None)
+        if errors:
+            raise RuntimeError(errors)
+        self._update_latest_version_info(result)
 
     def _create_new_unreleased(self) -> None:
         """Create a new unreleased version of an existing history and update this class
@@ -342,15 +448,49 @@ class RecordCreator:
         RuntimeError
             If an error occurs when creating a new unreleased version.
         """
-        versions_api = RecordsRecordVersionsApi(self.admin_client)
-        result = versions_api.get_modifiable_record_version(
+        result = self._versions_api.get_modifiable_record_version(
             database_key=DB_KEY,
-            table_guid=self._table_guid,
+            table_guid=self.table_guid,
             record_history_guid=self.history_guid,
             record_version_guid=self.latest_version_guid,
         )
-        try:
-            raise RuntimeError(result.errors)
-        except AttributeError:
-            pass
-        self._get_latest_version_info()
+        errors = getattr(result, "errors", None)
+        if errors:
+            raise RuntimeError(errors)
+        self._update_latest_version_info(result)
+
+
+def prepare_records(
+    admin_client: ApiClient, specs: Iterable[Tuple[str, GsaVersionState, int]]
+) -> Dict[str, RecordCreator]:
+    """Ensure the specified record versions exist, preparing different record histories
+    concurrently.
+
+    Versions of the same record history are prepared in the order provided by a single
+    :class:`RecordCreator`, since each step depends on the state left by the previous one.
+
+    Parameters
+    ----------
+    admin_client : ApiClient
+        Client to use for Server API record history and record version operations
+    specs : Iterable[Tuple[str, GsaVersionState, int]]
+        Record history name, version state and version number of each required version
+
+    Returns
+    -------
+    dict[str, RecordCreator]
+        Record creators used to prepare each record history, indexed by history name
+    """
+    versions_by_history: Dict[str, List[Tuple[GsaVersionState, int]]] = {}
+    for history_name, version_state, version_number in specs:
+        versions_by_history.setdefault(history_name, []).append((version_state, version_number))
+
+    def prepare_history(history_name: str) -> RecordCreator:
+        record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, history_name)
+        for version_state, version_number in versions_by_history[history_name]:
+            record_creator.get_or_create_version(version_state, version_number)
+        return record_creator
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        record_creators = executor.map(prepare_history, versions_by_history)
+        return dict(zip(versions_by_history, record_creators))
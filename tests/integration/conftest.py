@@ -20,14 +20,16 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from concurrent.futures import ThreadPoolExecutor
 import os
-from typing import List
+from typing import Callable, Dict, Iterable, List
 import uuid
 
-from ansys.grantami.serverapi_openapi.api import SchemaDatabasesApi, SchemaTablesApi, SearchApi
+from ansys.grantami.serverapi_openapi.api import SearchApi
 from ansys.grantami.serverapi_openapi.models import (
     GsaBooleanCriterion,
     GsaDiscreteTextValuesDatumCriterion,
+    GsaPagingOptions,
     GsaRecordPropertyCriterion,
     GsaSearchableRecordProperty,
     GsaSearchRequest,
@@ -35,10 +37,26 @@ from ansys.grantami.serverapi_openapi.models import (
     GsaTextMatchBehavior,
     GsaVersionState,
 )
-from common import DB_KEY, TABLE_NAME, RecordCreator
+from ansys.openapi.common import Unset
+from common import (
+    DB_KEY,
+    TABLE_NAME,
+    RecordCreator,
+    get_database_guids,
+    get_table_guids,
+    prefetch_histories,
+    prepare_records,
+)
 import pytest
 
-from ansys.grantami.recordlists import Connection, RecordList, RecordListItem, RecordListsApiClient
+from ansys.grantami.recordlists import (
+    BooleanCriterion,
+    Connection,
+    RecordList,
+    RecordListItem,
+    RecordListsApiClient,
+    SearchCriterion,
+)
 
 
 @pytest.fixture(scope="session")
@@ -66,33 +84,54 @@ def list_password_no_permissions() -> str:
     return os.getenv("TEST_LIST_PASS")
 
 
+def _delete_lists(client: RecordListsApiClient, record_lists: Iterable[RecordList]) -> None:
+    """Delete the provided lists concurrently."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(client.delete_list, record_lists))
+
+
+def _delete_session_lists(client: RecordListsApiClient, list_names: Iterable[str]) -> None:
+    """Delete all lists whose name contains any of ``list_names``.
+
+    Lists are filtered by name on the server in a single search, so only lists created during
+    the session are returned.
+    """
+    criterion = BooleanCriterion(
+        match_any=[SearchCriterion(name_contains=list_name) for list_name in list_names]
+    )
+    results = client.search_for_lists(criterion)
+    _delete_lists(client, (result.record_list for result in results))
+
+
 @pytest.fixture(scope="session")
 def admin_client(
-    sl_url, list_admin_username, list_admin_password, list_name
+    sl_url, list_admin_username, list_admin_password, list_name, shared_list_name
 ) -> RecordListsApiClient:
     """
     Fixture providing a real ApiClient to run integration tests against an instance of Granta MI
     Server API.
-    On teardown, deletes all lists named using the fixture `list_name`.
-    """
-    connection = Connection(sl_url).with_credentials(list_admin_username, list_admin_password)
+    On teardown, deletes all lists named using the fixtures `list_name` and `shared_list_name`.
+    On Windows, connects with autologon if no admin username is configured.
+    """
+    connection = Connection(sl_url)
+    if os.name == "nt" and not list_admin_username:
+        connection = connection.with_autologon()
+    else:
+        connection = connection.with_credentials(list_admin_username, list_admin_password)
     client = connection.connect()
     yield client
 
-    all_lists = client.get_all_lists()
-    for record_list in all_lists:
-        if list_name in record_list.name:
-            client.delete_list(record_list)
+    _delete_session_lists(client, [list_name, shared_list_name])
 
 
 @pytest.fixture(scope="session")
 def basic_client(
-    sl_url, list_username_no_permissions, list_password_no_permissions, list_name
+    sl_url, list_username_no_permissions, list_password_no_permissions, list_name, shared_list_name
 ) -> RecordListsApiClient:
     """
     Fixture providing a real ApiClient to run integration tests against an instance of Granta MI
     Server API.
-    On teardown, deletes all lists named using the fixture `list_name`.
+    On teardown, deletes all lists named using the fixtures `list_name` and `shared_list_name`.
     """
     connection = Connection(sl_url).with_credentials(
         list_username_no_permissions,
@@ -101,10 +140,7 @@ def basic_client(
     client = connection.connect()
     yield client
 
-    all_lists = client.get_all_lists()
-    for record_list in all_lists:
-        if list_name in record_list.name:
-            client.delete_list(record_list)
+    _delete_session_lists(client, [list_name, shared_list_name])
 
 
 @pytest.fixture(scope="session")
@@ -124,122 +160,216 @@ def list_name(unique_id) -> str:
     return f"{prefix}_{unique_id}"
 
 
+@pytest.fixture(scope="session")
+def shared_list_name(unique_id) -> str:
+    """
+    Provides a name for lists shared by read-only tests. The name does not contain `list_name`,
+    so shared lists are not included in searches for lists created by individual tests.
+    """
+    prefix = "IntegrationTestSharedList"
+    return f"{prefix}_{unique_id}"
+
+
 @pytest.fixture
-def new_list(admin_client, request, list_name) -> RecordList:
+def list_cleanup(request) -> bool:
+    """
+    Whether lists created by the `new_list`, `new_basic_list` and `basic_list` fixtures are deleted
+    on teardown. Parametrize indirectly with `False` for tests which delete the list themselves.
+    """
+    return getattr(request, "param", True)
+
+
+@pytest.fixture
+def new_list(admin_client, request, list_name, list_cleanup) -> RecordList:
     """
     Provides the identifier of newly created list.
     The created list include the name of the calling test as a `description`.
     """
     new_list = admin_client.create_list(name=list_name, description=request.node.name)
-    cleanup = getattr(request, "param", {}).get("cleanup", True)
     yield new_list
-    if cleanup:
+    if list_cleanup:
         admin_client.delete_list(new_list)
 
 
-@pytest.fixture
-def new_list_with_one_unresolvable_item(admin_client, new_list, unresolvable_item) -> RecordList:
-    items = [unresolvable_item]
-    admin_client.add_items_to_list(new_list, items)
-    return new_list
+def _create_shared_lists(client: RecordListsApiClient, list_name: str, description: str):
+    """Yield a function which creates lists with the provided items, and delete them afterwards."""
+    created_lists = []
 
+    def create_list(items: List[RecordListItem]) -> RecordList:
+        record_list = client.create_list(name=list_name, description=description, items=items)
+        created_lists.append(record_list)
+        return record_list
 
-@pytest.fixture
-def new_list_with_many_unresolvable_items(
-    admin_client, new_list, many_unresolvable_items
+    yield create_list
+    _delete_lists(client, created_lists)
+
+
+@pytest.fixture(scope="module")
+def create_shared_list(admin_client, shared_list_name, request) -> Callable[..., RecordList]:
+    """
+    Provides a function which creates a list with the provided items, for use by tests which do
+    not modify the list. Lists are shared by all tests in the module, and are deleted on module
+    teardown.
+    """
+    yield from _create_shared_lists(admin_client, shared_list_name, request.node.name)
+
+
+@pytest.fixture(scope="module")
+def create_shared_basic_list(basic_client, shared_list_name, request) -> Callable[..., RecordList]:
+    """
+    Same as `create_shared_list`, but lists are created by the basic user.
+    """
+    yield from _create_shared_lists(basic_client, shared_list_name, request.node.name)
+
+
+@pytest.fixture(scope="module")
+def shared_list_with_one_unresolvable_item(create_shared_list, unresolvable_item) -> RecordList:
+    return create_shared_list([unresolvable_item])
+
+
+@pytest.fixture(scope="module")
+def shared_list_with_many_unresolvable_items(
+    create_shared_list, many_unresolvable_items
 ) -> RecordList:
-    admin_client.add_items_to_list(new_list, many_unresolvable_items)
-    return new_list
+    return create_shared_list(many_unresolvable_items)
 
 
 @pytest.fixture(scope="session")
 def training_database_guid(admin_client) -> str:
-    schema_api = SchemaDatabasesApi(admin_client)
-    dbs = schema_api.get_all_databases()
-    return next(db.guid for db in dbs.databases if db.key == DB_KEY)
+    return get_database_guids(admin_client)[DB_KEY]
 
 
 @pytest.fixture(scope="session")
 def design_data_table_guid(admin_client) -> str:
-    table_api = SchemaTablesApi(admin_client)
-    table_response = table_api.get_tables(database_key=DB_KEY)
-    return next(table.guid for table in table_response.tables if table.name == TABLE_NAME)
+    return get_table_guids(admin_client, DB_KEY)[TABLE_NAME]
 
 
-@pytest.fixture(scope="session")
-def resolvable_items(admin_client, training_database_guid) -> List[RecordListItem]:
-    """Get all records in the MI_Training database and use them to create
-    a list of RecordListItems which can be added to a list.
+_IS_ANY_RECORD_TYPE = GsaRecordPropertyCriterion(
+    _property=GsaSearchableRecordProperty.RECORDTYPE,
+    inner_criterion=GsaDiscreteTextValuesDatumCriterion(
+        any=["Record", "Generic", "Folder"],
+    ),
+)
+_IS_IN_TENSILE_TEST_DATA_TABLE = GsaRecordPropertyCriterion(
+    _property=GsaSearchableRecordProperty.TABLENAME,
+    inner_criterion=GsaShortTextDatumCriterion(
+        text_match_behavior=GsaTextMatchBehavior.EXACTMATCH,
+        value="Tensile Test Data",
+    ),
+)
+
+
+def _search_resolvable_records(admin_client, paging_options=Unset) -> list:
+    """Search for records in the MI_Training database which can be added to a list.
 
     Exclude records in the 'Tensile Test Data' table, since this is used in the
     grantami-jobqueue integration tests, and the changing contents of the table
     can cause test failures.
     """
     search_api = SearchApi(admin_client)
-
-    is_any_record_type = GsaRecordPropertyCriterion(
-        _property=GsaSearchableRecordProperty.RECORDTYPE,
-        inner_criterion=GsaDiscreteTextValuesDatumCriterion(
-            any=["Record", "Generic", "Folder"],
-        ),
-    )
-    is_in_tensile_test_data_table = GsaRecordPropertyCriterion(
-        _property=GsaSearchableRecordProperty.TABLENAME,
-        inner_criterion=GsaShortTextDatumCriterion(
-            text_match_behavior=GsaTextMatchBehavior.EXACTMATCH,
-            value="Tensile Test Data",
-        ),
-    )
-
     search_body = GsaSearchRequest(
         criterion=GsaBooleanCriterion(
-            all=[is_any_record_type],
-            _none=[is_in_tensile_test_data_table],
-        )
+            all=[_IS_ANY_RECORD_TYPE],
+            _none=[_IS_IN_TENSILE_TEST_DATA_TABLE],
+        ),
+        paging_options=paging_options,
     )
     search_results = search_api.database_search(
         database_key=DB_KEY,
         body=search_body,
     )
+    return search_results.results
+
+
+@pytest.fixture(scope="session")
+def resolvable_items(admin_client, training_database_guid) -> List[RecordListItem]:
+    """Get all records in the MI_Training database and use them to create
+    a list of RecordListItems which can be added to a list.
+    """
     return [
         RecordListItem(
             training_database_guid,
             result.table_guid,
             result.record_history_guid,
         )
-        for result in search_results.results
+        for result in _search_resolvable_records(admin_client)
     ]
 
 
-@pytest.fixture
-def new_list_with_one_resolvable_item(admin_client, new_list, resolvable_items) -> RecordList:
-    admin_client.add_items_to_list(new_list, [resolvable_items[0]])
-    return new_list
+@pytest.fixture(scope="session")
+def one_resolvable_item(admin_client, training_database_guid) -> RecordListItem:
+    """Get a single record in the MI_Training database as a RecordListItem which can be added
+    to a list.
 
+    Only the first page of search results, with a single result, is requested.
+    """
+    result = _search_resolvable_records(admin_client, GsaPagingOptions(page_size=1))[0]
+    return RecordListItem(
+        training_database_guid,
+        result.table_guid,
+        result.record_history_guid,
+    )
 
-@pytest.fixture
-def new_list_with_many_resolvable_items(admin_client, new_list, resolvable_items) -> RecordList:
-    admin_client.add_items_to_list(new_list, resolvable_items)
-    return new_list
 
+@pytest.fixture(scope="module")
+def shared_list_with_one_resolvable_item(create_shared_list, one_resolvable_item) -> RecordList:
+    return create_shared_list([one_resolvable_item])
 
-@pytest.fixture
-def new_list_with_many_resolvable_and_unresolvable_items(
-    admin_client, new_list, resolvable_items, many_unresolvable_items
+
+@pytest.fixture(scope="module")
+def shared_list_with_many_resolvable_items(create_shared_list, resolvable_items) -> RecordList:
+    return create_shared_list(resolvable_items)
+
+
+@pytest.fixture(scope="session")
+def resolvable_and_unresolvable_items(
+    resolvable_items, many_unresolvable_items
+) -> List[RecordListItem]:
+    return resolvable_items + many_unresolvable_items
+
+
+@pytest.fixture(scope="module")
+def shared_list_with_many_resolvable_and_unresolvable_items(
+    create_shared_list, resolvable_and_unresolvable_items
 ) -> RecordList:
-    admin_client.add_items_to_list(new_list, resolvable_items + many_unresolvable_items)
-    return new_list
+    return create_shared_list(resolvable_and_unresolvable_items)
+
+
+@pytest.fixture(scope="session")
+def record_creators(admin_client) -> Dict[str, RecordCreator]:
+    """Prepare all record versions used by the item fixtures below.
+
+    Record histories are found in a single search, and independent histories are prepared
+    concurrently. The table and database GUIDs are looked up once beforehand, so concurrent
+    record creators share the cached results.
+    """
+    specs = [
+        ("UnreleasedRecord", GsaVersionState.UNRELEASED, 1),
+        ("ReleasedRecord", GsaVersionState.RELEASED, 1),
+        ("SupersededRecord", GsaVersionState.SUPERSEDED, 1),
+        ("DraftSupersededRecord", GsaVersionState.RELEASED, 1),
+        ("DraftSupersededRecord", GsaVersionState.UNRELEASED, 2),
+    ]
+    history_names = dict.fromkeys(history_name for history_name, _, _ in specs)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(get_table_guids, admin_client, DB_KEY),
+            executor.submit(get_database_guids, admin_client),
+            executor.submit(prefetch_histories, admin_client, history_names),
+        ]
+        for future in futures:
+            future.result()
+    return prepare_records(admin_client, specs)
 
 
 @pytest.fixture(scope="session")
-def unreleased_item(admin_client) -> RecordListItem:
+def unreleased_item(record_creators) -> RecordListItem:
     """
     History
     |
     |-- Version 1 (unreleased) *
     """
-    record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, "UnreleasedRecord")
-    record_creator.get_or_create_version(GsaVersionState.UNRELEASED, 1)
+    record_creator = record_creators["UnreleasedRecord"]
     return RecordListItem(
         database_guid=record_creator.database_guid,
         table_guid=record_creator.table_guid,
@@ -249,14 +379,13 @@ def unreleased_item(admin_client) -> RecordListItem:
 
 
 @pytest.fixture(scope="session")
-def released_item(admin_client) -> RecordListItem:
+def released_item(record_creators) -> RecordListItem:
     """
     History
     |
     |-- Version 1 (released) *
     """
-    record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, "ReleasedRecord")
-    record_creator.get_or_create_version(GsaVersionState.RELEASED, 1)
+    record_creator = record_creators["ReleasedRecord"]
     return RecordListItem(
         database_guid=record_creator.database_guid,
         table_guid=record_creator.table_guid,
@@ -266,15 +395,14 @@ def released_item(admin_client) -> RecordListItem:
 
 
 @pytest.fixture(scope="session")
-def superseded_item(admin_client) -> RecordListItem:
+def superseded_item(record_creators) -> RecordListItem:
     """
     History
     |
     |-- Version 1 (superseded) *
     |-- Version 2 (released)
     """
-    record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, "SupersededRecord")
-    record_creator.get_or_create_version(GsaVersionState.SUPERSEDED, 1)
+    record_creator = record_creators["SupersededRecord"]
     return RecordListItem(
         database_guid=record_creator.database_guid,
         table_guid=record_creator.table_guid,
@@ -284,15 +412,14 @@ def superseded_item(admin_client) -> RecordListItem:
 
 
 @pytest.fixture(scope="session")
-def draft_superseded_item(admin_client) -> RecordListItem:
+def draft_superseded_item(record_creators) -> RecordListItem:
     """
     History
     |
     |-- Version 1 (released) *
     |-- Version 2 (unreleased)
     """
-    record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, "DraftSupersededRecord")
-    record_creator.get_or_create_version(GsaVersionState.RELEASED, 1)
+    record_creator = record_creators["DraftSupersededRecord"]
     return RecordListItem(
         database_guid=record_creator.database_guid,
         table_guid=record_creator.table_guid,
@@ -302,15 +429,14 @@ def draft_superseded_item(admin_client) -> RecordListItem:
 
 
 @pytest.fixture(scope="session")
-def draft_superseding_item(admin_client) -> RecordListItem:
+def draft_superseding_item(record_creators) -> RecordListItem:
     """
     History
     |
     |-- Version 1 (released)
     |-- Version 2 (unreleased) *
     """
-    record_creator = RecordCreator(admin_client, DB_KEY, TABLE_NAME, "DraftSupersededRecord")
-    record_creator.get_or_create_version(GsaVersionState.UNRELEASED, 2)
+    record_creator = record_creators["DraftSupersededRecord"]
     return RecordListItem(
         database_guid=record_creator.database_guid,
         table_guid=record_creator.table_guid,
@@ -319,333 +445,128 @@ def draft_superseding_item(admin_client) -> RecordListItem:
     )
 
 
-@pytest.fixture
-def new_admin_list_with_one_unreleased_item(admin_client, new_list, unreleased_item) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (unreleased) *
-    """
-    admin_client.add_items_to_list(new_list, [unreleased_item])
-    return new_list
-
+def _item_by_history(item_fixture: str):
+    """Create a session-scoped fixture which provides an item by record history only.
 
-@pytest.fixture
-def new_admin_list_with_one_unreleased_item_by_history(
-    admin_client, new_list, unreleased_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (unreleased) *
+    Parameters
+    ----------
+    item_fixture : str
+        Name of the fixture providing the item by record version
     """
-    item = RecordListItem(
-        database_guid=unreleased_item.database_guid,
-        table_guid=unreleased_item.table_guid,
-        record_history_guid=unreleased_item.record_history_guid,
-    )
-    admin_client.add_items_to_list(new_list, [item])
-    return new_list
-
-
-@pytest.fixture
-def new_admin_list_with_one_released_item(admin_client, new_list, released_item) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    """
-    admin_client.add_items_to_list(new_list, [released_item])
-    return new_list
 
+    def item_by_history(request) -> RecordListItem:
+        item = request.getfixturevalue(item_fixture)
+        return RecordListItem(
+            database_guid=item.database_guid,
+            table_guid=item.table_guid,
+            record_history_guid=item.record_history_guid,
+        )
 
-@pytest.fixture
-def new_admin_list_with_one_released_item_by_history(
-    admin_client, new_list, released_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    """
-    item = RecordListItem(
-        database_guid=released_item.database_guid,
-        table_guid=released_item.table_guid,
-        record_history_guid=released_item.record_history_guid,
-    )
-    admin_client.add_items_to_list(new_list, [item])
-    return new_list
-
-
-@pytest.fixture
-def new_admin_list_with_one_superseded_item(admin_client, new_list, superseded_item) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (superseded) *
-    |-- Version 2 (released)
-    """
-    admin_client.add_items_to_list(new_list, [superseded_item])
-    return new_list
-
-
-@pytest.fixture
-def new_admin_list_with_one_superseded_item_by_history(
-    admin_client, new_list, superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (superseded) *
-    |-- Version 2 (released)
-    """
-    item = RecordListItem(
-        database_guid=superseded_item.database_guid,
-        table_guid=superseded_item.table_guid,
-        record_history_guid=superseded_item.record_history_guid,
-    )
-    admin_client.add_items_to_list(new_list, [item])
-    return new_list
-
-
-@pytest.fixture
-def new_admin_list_with_one_draft_superseded_item(
-    admin_client, new_list, draft_superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    |-- Version 2 (unreleased)
-    """
-    admin_client.add_items_to_list(new_list, [draft_superseded_item])
-    return new_list
-
-
-@pytest.fixture
-def new_admin_list_with_one_draft_superseded_item_by_history(
-    admin_client, new_list, draft_superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    |-- Version 2 (unreleased)
-    """
-    item = RecordListItem(
-        database_guid=draft_superseded_item.database_guid,
-        table_guid=draft_superseded_item.table_guid,
-        record_history_guid=draft_superseded_item.record_history_guid,
-    )
-    admin_client.add_items_to_list(new_list, [item])
-    return new_list
-
+    return pytest.fixture(item_by_history, scope="session")
 
-@pytest.fixture
-def new_admin_list_with_one_draft_superseding_item(
-    admin_client, new_list, draft_superseding_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released)
-    |-- Version 2 (unreleased) *
-    """
-    admin_client.add_items_to_list(new_list, [draft_superseding_item])
-    return new_list
 
-
-@pytest.fixture
-def new_admin_list_with_one_draft_superseding_item_by_history(
-    admin_client, new_list, draft_superseding_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released)
-    |-- Version 2 (unreleased) *
-    """
-    item = RecordListItem(
-        database_guid=draft_superseding_item.database_guid,
-        table_guid=draft_superseding_item.table_guid,
-        record_history_guid=draft_superseding_item.record_history_guid,
-    )
-    admin_client.add_items_to_list(new_list, [item])
-    return new_list
+unreleased_item_by_history = _item_by_history("unreleased_item")
+released_item_by_history = _item_by_history("released_item")
+superseded_item_by_history = _item_by_history("superseded_item")
+draft_superseded_item_by_history = _item_by_history("draft_superseded_item")
+draft_superseding_item_by_history = _item_by_history("draft_superseding_item")
 
 
 @pytest.fixture
-def new_basic_list(basic_client, request, list_name) -> RecordList:
+def new_basic_list(basic_client, request, list_name, list_cleanup) -> RecordList:
     """
     Provides the identifier of newly created list.
     The created list include the name of the calling test as a `description`.
     """
     new_list = basic_client.create_list(name=list_name, description=request.node.name)
-    cleanup = getattr(request, "param", {}).get("cleanup", True)
     yield new_list
-    if cleanup:
+    if list_cleanup:
         basic_client.delete_list(new_list)
 
 
-@pytest.fixture
-def new_basic_list_with_one_unreleased_item(
-    basic_client, new_basic_list, unreleased_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (unreleased) *
-    """
-    basic_client.add_items_to_list(new_basic_list, [unreleased_item])
-    return new_basic_list
-
-
-@pytest.fixture
-def new_basic_list_with_one_unreleased_item_by_history(
-    basic_client, new_basic_list, unreleased_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (unreleased) *
-    """
-    item = RecordListItem(
-        database_guid=unreleased_item.database_guid,
-        table_guid=unreleased_item.table_guid,
-        record_history_guid=unreleased_item.record_history_guid,
-    )
-    basic_client.add_items_to_list(new_basic_list, [item])
-    return new_basic_list
-
-
-@pytest.fixture
-def new_basic_list_with_one_released_item(
-    basic_client, new_basic_list, released_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    """
-    basic_client.add_items_to_list(new_basic_list, [released_item])
-    return new_basic_list
-
-
-@pytest.fixture
-def new_basic_list_with_one_released_item_by_history(
-    basic_client, new_basic_list, released_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    """
-    item = RecordListItem(
-        database_guid=released_item.database_guid,
-        table_guid=released_item.table_guid,
-        record_history_guid=released_item.record_history_guid,
-    )
-    basic_client.add_items_to_list(new_basic_list, [item])
-    return new_basic_list
-
-
-@pytest.fixture
-def new_basic_list_with_one_superseded_item(
-    basic_client, new_basic_list, superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (superseded) *
-    |-- Version 2 (released)
-    """
-    basic_client.add_items_to_list(new_basic_list, [superseded_item])
-    return new_basic_list
-
-
-@pytest.fixture
-def new_basic_list_with_one_superseded_item_by_history(
-    basic_client, new_basic_list, superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (superseded) *
-    |-- Version 2 (released)
-    """
-    item = RecordListItem(
-        database_guid=superseded_item.database_guid,
-        table_guid=superseded_item.table_guid,
-        record_history_guid=superseded_item.record_history_guid,
-    )
-    basic_client.add_items_to_list(new_basic_list, [item])
-    return new_basic_list
+def _list_with_one_item(create_fixture: str, item_fixture: str):
+    """Create a module-scoped fixture which provides a shared list containing a single item.
 
+    The list is shared by all tests in the module, and so must not be modified by tests.
 
-@pytest.fixture
-def new_basic_list_with_one_draft_superseded_item(
-    basic_client, new_basic_list, draft_superseded_item
-) -> RecordList:
+    Parameters
+    ----------
+    create_fixture : str
+        Name of the fixture providing the function used to create the shared list
+    item_fixture : str
+        Name of the fixture providing the item. See the item fixture for the state of the record
+        history.
     """
-    History
-    |
-    |-- Version 1 (released) *
-    |-- Version 2 (unreleased)
-    """
-    basic_client.add_items_to_list(new_basic_list, [draft_superseded_item])
-    return new_basic_list
 
+    def list_with_one_item(request) -> RecordList:
+        create_list = request.getfixturevalue(create_fixture)
+        item = request.getfixturevalue(item_fixture)
+        return create_list([item])
 
-@pytest.fixture
-def new_basic_list_with_one_draft_superseded_item_by_history(
-    basic_client, new_basic_list, draft_superseded_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released) *
-    |-- Version 2 (unreleased)
-    """
-    item = RecordListItem(
-        database_guid=draft_superseded_item.database_guid,
-        table_guid=draft_superseded_item.table_guid,
-        record_history_guid=draft_superseded_item.record_history_guid,
-    )
-    basic_client.add_items_to_list(new_basic_list, [item])
-    return new_basic_list
+    return pytest.fixture(list_with_one_item, scope="module")
 
 
-@pytest.fixture
-def new_basic_list_with_one_draft_superseding_item(
-    basic_client, new_basic_list, draft_superseding_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released)
-    |-- Version 2 (unreleased) *
-    """
-    basic_client.add_items_to_list(new_basic_list, [draft_superseding_item])
-    return new_basic_list
-
+shared_admin_list_with_one_unreleased_item = _list_with_one_item(
+    "create_shared_list", "unreleased_item"
+)
+shared_admin_list_with_one_unreleased_item_by_history = _list_with_one_item(
+    "create_shared_list", "unreleased_item_by_history"
+)
+shared_admin_list_with_one_released_item = _list_with_one_item(
+    "create_shared_list", "released_item"
+)
+shared_admin_list_with_one_released_item_by_history = _list_with_one_item(
+    "create_shared_list", "released_item_by_history"
+)
+shared_admin_list_with_one_superseded_item = _list_with_one_item(
+    "create_shared_list", "superseded_item"
+)
+shared_admin_list_with_one_superseded_item_by_history = _list_with_one_item(
+    "create_shared_list", "superseded_item_by_history"
+)
+shared_admin_list_with_one_draft_superseded_item = _list_with_one_item(
+    "create_shared_list", "draft_superseded_item"
+)
+shared_admin_list_with_one_draft_superseded_item_by_history = _list_with_one_item(
+    "create_shared_list", "draft_superseded_item_by_history"
+)
+shared_admin_list_with_one_draft_superseding_item = _list_with_one_item(
+    "create_shared_list", "draft_superseding_item"
+)
+shared_admin_list_with_one_draft_superseding_item_by_history = _list_with_one_item(
+    "create_shared_list", "draft_superseding_item_by_history"
+)
 
-@pytest.fixture
-def new_basic_list_with_one_draft_superseding_item_by_history(
-    basic_client, new_basic_list, draft_superseding_item
-) -> RecordList:
-    """
-    History
-    |
-    |-- Version 1 (released)
-    |-- Version 2 (unreleased) *
-    """
-    item = RecordListItem(
-        database_guid=draft_superseding_item.database_guid,
-        table_guid=draft_superseding_item.table_guid,
-        record_history_guid=draft_superseding_item.record_history_guid,
-    )
-    basic_client.add_items_to_list(new_basic_list, [item])
-    return new_basic_list
+shared_basic_list_with_one_unreleased_item = _list_with_one_item(
+    "create_shared_basic_list", "unreleased_item"
+)
+shared_basic_list_with_one_unreleased_item_by_history = _list_with_one_item(
+    "create_shared_basic_list", "unreleased_item_by_history"
+)
+shared_basic_list_with_one_released_item = _list_with_one_item(
+    "create_shared_basic_list", "released_item"
+)
+shared_basic_list_with_one_released_item_by_history = _list_with_one_item(
+    "create_shared_basic_list", "released_item_by_history"
+)
+shared_basic_list_with_one_superseded_item = _list_with_one_item(
+    "create_shared_basic_list", "superseded_item"
+)
+shared_basic_list_with_one_superseded_item_by_history = _list_with_one_item(
+    "create_shared_basic_list", "superseded_item_by_history"
+)
+shared_basic_list_with_one_draft_superseded_item = _list_with_one_item(
+    "create_shared_basic_list", "draft_superseded_item"
+)
+shared_basic_list_with_one_draft_superseded_item_by_history = _list_with_one_item(
+    "create_shared_basic_list", "draft_superseded_item_by_history"
+)
+shared_basic_list_with_one_draft_superseding_item = _list_with_one_item(
+    "create_shared_basic_list", "draft_superseding_item"
+)
+shared_basic_list_with_one_draft_superseding_item_by_history = _list_with_one_item(
+    "create_shared_basic_list", "draft_superseding_item_by_history"
+)
 
 
 @pytest.fixture(scope="function")
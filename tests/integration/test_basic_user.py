@@ -34,11 +34,10 @@ def test_create_list(basic_client, list_name):
 
 
 @pytest.fixture
-def basic_list(basic_client, list_name, request):
+def basic_list(basic_client, list_name, list_cleanup):
     new_list = basic_client.create_list(name=list_name)
-    cleanup = getattr(request, "param", {}).get("cleanup", True)
     yield new_list
-    if cleanup:
+    if list_cleanup:
         basic_client.delete_list(new_list)
 
 
@@ -48,9 +48,9 @@ class TestListItems:
     def test_get_list_items_one_unresolvable_item(
         self,
         admin_client,
-        new_list_with_one_unresolvable_item,
+        shared_list_with_one_unresolvable_item,
     ):
-        record_list_items = admin_client.get_list_items(new_list_with_one_unresolvable_item)
+        record_list_items = admin_client.get_list_items(shared_list_with_one_unresolvable_item)
 
         assert isinstance(record_list_items, list)
         assert all(isinstance(item, RecordListItem) for item in record_list_items)
@@ -59,10 +59,10 @@ class TestListItems:
     def test_get_list_items_many_unresolvable_items(
         self,
         admin_client,
-        new_list_with_many_unresolvable_items,
+        shared_list_with_many_unresolvable_items,
         many_unresolvable_items,
     ):
-        record_list_items = admin_client.get_list_items(new_list_with_many_unresolvable_items)
+        record_list_items = admin_client.get_list_items(shared_list_with_many_unresolvable_items)
 
         assert isinstance(record_list_items, list)
         assert all(isinstance(item, RecordListItem) for item in record_list_items)
@@ -97,10 +97,10 @@ class TestItemResolvability:
     def test_get_list_items_one_unresolvable_item(
         self,
         admin_client,
-        new_list_with_one_unresolvable_item,
+        shared_list_with_one_unresolvable_item,
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_list_with_one_unresolvable_item
+            shared_list_with_one_unresolvable_item
         )
 
         assert isinstance(record_list_items, list)
@@ -110,11 +110,11 @@ class TestItemResolvability:
     def test_get_list_items_many_unresolvable_items(
         self,
         admin_client,
-        new_list_with_many_unresolvable_items,
+        shared_list_with_many_unresolvable_items,
         many_unresolvable_items,
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_list_with_many_unresolvable_items
+            shared_list_with_many_unresolvable_items
         )
 
         assert isinstance(record_list_items, list)
@@ -124,10 +124,10 @@ class TestItemResolvability:
     def test_get_list_items_one_resolvable_item(
         self,
         admin_client,
-        new_list_with_one_resolvable_item,
+        shared_list_with_one_resolvable_item,
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_list_with_one_resolvable_item
+            shared_list_with_one_resolvable_item
         )
 
         assert isinstance(record_list_items, list)
@@ -137,11 +137,11 @@ class TestItemResolvability:
     def test_get_list_items_many_resolvable_items(
         self,
         admin_client,
-        new_list_with_many_resolvable_items,
+        shared_list_with_many_resolvable_items,
         resolvable_items,
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_list_with_many_resolvable_items
+            shared_list_with_many_resolvable_items
         )
 
         assert isinstance(record_list_items, list)
@@ -151,11 +151,11 @@ class TestItemResolvability:
     def test_get_list_items_many_resolvable_and_unresolvable_items(
         self,
         admin_client,
-        new_list_with_many_resolvable_and_unresolvable_items,
+        shared_list_with_many_resolvable_and_unresolvable_items,
         resolvable_items,
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_list_with_many_resolvable_and_unresolvable_items
+            shared_list_with_many_resolvable_and_unresolvable_items
         )
 
         assert isinstance(record_list_items, list)
@@ -185,127 +185,127 @@ class TestItemResolvabilityVersionControl:
         assert len(record_list_items) == 0
 
     def test_admin_user_can_resolve_unreleased_item(
-        self, admin_client, new_admin_list_with_one_unreleased_item
+        self, admin_client, shared_admin_list_with_one_unreleased_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_unreleased_item
+            shared_admin_list_with_one_unreleased_item
         )
         self.check_resolved_record(record_list_items, record_version=1, record_guid_check=False)
 
     def test_admin_user_can_resolve_released_item(
-        self, admin_client, new_admin_list_with_one_released_item
+        self, admin_client, shared_admin_list_with_one_released_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_released_item
+            shared_admin_list_with_one_released_item
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_admin_user_can_resolve_draft_superseded_item(
-        self, admin_client, new_admin_list_with_one_draft_superseded_item
+        self, admin_client, shared_admin_list_with_one_draft_superseded_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseded_item
+            shared_admin_list_with_one_draft_superseded_item
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_admin_user_can_resolve_draft_superseding_item(
-        self, admin_client, new_admin_list_with_one_draft_superseding_item
+        self, admin_client, shared_admin_list_with_one_draft_superseding_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseding_item
+            shared_admin_list_with_one_draft_superseding_item
         )
         self.check_resolved_record(record_list_items, record_version=2, record_guid_check=False)
 
     def test_admin_user_can_resolve_superseded_item(
-        self, admin_client, new_admin_list_with_one_superseded_item
+        self, admin_client, shared_admin_list_with_one_superseded_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_superseded_item
+            shared_admin_list_with_one_superseded_item
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_admin_user_read_mode_cannot_resolve_unreleased_item(
-        self, admin_client, new_admin_list_with_one_unreleased_item
+        self, admin_client, shared_admin_list_with_one_unreleased_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_unreleased_item,
+            shared_admin_list_with_one_unreleased_item,
             read_mode=True,
         )
         self.check_unresolved_record(record_list_items)
 
     def test_admin_user_read_mode_can_resolve_released_item(
-        self, admin_client, new_admin_list_with_one_released_item
+        self, admin_client, shared_admin_list_with_one_released_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_released_item,
+            shared_admin_list_with_one_released_item,
             read_mode=True,
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_admin_user_read_mode_can_resolve_draft_superseded_item(
-        self, admin_client, new_admin_list_with_one_draft_superseded_item
+        self, admin_client, shared_admin_list_with_one_draft_superseded_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseded_item,
+            shared_admin_list_with_one_draft_superseded_item,
             read_mode=True,
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_admin_user_read_mode_cannot_resolve_draft_superseding_item(
-        self, admin_client, new_admin_list_with_one_draft_superseding_item
+        self, admin_client, shared_admin_list_with_one_draft_superseding_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseding_item,
+            shared_admin_list_with_one_draft_superseding_item,
             read_mode=True,
         )
         self.check_unresolved_record(record_list_items)
 
     def test_admin_user_read_mode_can_resolve_superseded_item(
-        self, admin_client, new_admin_list_with_one_superseded_item
+        self, admin_client, shared_admin_list_with_one_superseded_item
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_superseded_item,
+            shared_admin_list_with_one_superseded_item,
             read_mode=True,
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_read_user_cannot_resolve_unreleased_item(
-        self, basic_client, new_basic_list_with_one_unreleased_item
+        self, basic_client, shared_basic_list_with_one_unreleased_item
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_unreleased_item
+            shared_basic_list_with_one_unreleased_item
         )
         self.check_unresolved_record(record_list_items)
 
     def test_read_user_can_resolve_released_item(
-        self, basic_client, new_basic_list_with_one_released_item
+        self, basic_client, shared_basic_list_with_one_released_item
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_released_item
+            shared_basic_list_with_one_released_item
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_read_user_can_resolve_draft_superseded_item(
-        self, basic_client, new_basic_list_with_one_draft_superseded_item
+        self, basic_client, shared_basic_list_with_one_draft_superseded_item
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_draft_superseded_item,
+            shared_basic_list_with_one_draft_superseded_item,
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
     def test_read_user_cannot_resolve_draft_superseding_item(
-        self, basic_client, new_basic_list_with_one_draft_superseding_item
+        self, basic_client, shared_basic_list_with_one_draft_superseding_item
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_draft_superseding_item
+            shared_basic_list_with_one_draft_superseding_item
         )
         self.check_unresolved_record(record_list_items)
 
     def test_read_user_can_resolve_superseded_item(
-        self, basic_client, new_basic_list_with_one_superseded_item
+        self, basic_client, shared_basic_list_with_one_superseded_item
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_superseded_item
+            shared_basic_list_with_one_superseded_item
         )
         self.check_resolved_record(record_list_items, record_version=1)
 
@@ -331,131 +331,131 @@ class TestItemResolvabilityVersionControlByHistory:
         assert len(record_list_items) == 0
 
     def test_admin_user_can_resolve_unreleased_item_by_history(
-        self, admin_client, new_admin_list_with_one_unreleased_item_by_history
+        self, admin_client, shared_admin_list_with_one_unreleased_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_unreleased_item_by_history
+            shared_admin_list_with_one_unreleased_item_by_history
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_can_resolve_released_item_by_history(
-        self, admin_client, new_admin_list_with_one_released_item_by_history
+        self, admin_client, shared_admin_list_with_one_released_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_released_item_by_history
+            shared_admin_list_with_one_released_item_by_history
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_can_resolve_draft_superseded_item_by_history(
-        self, admin_client, new_admin_list_with_one_draft_superseded_item_by_history
+        self, admin_client, shared_admin_list_with_one_draft_superseded_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseded_item_by_history
+            shared_admin_list_with_one_draft_superseded_item_by_history
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_can_resolve_draft_superseding_item_by_history(
-        self, admin_client, new_admin_list_with_one_draft_superseding_item_by_history
+        self, admin_client, shared_admin_list_with_one_draft_superseding_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseding_item_by_history
+            shared_admin_list_with_one_draft_superseding_item_by_history
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_can_resolve_superseded_item_by_history(
-        self, admin_client, new_admin_list_with_one_superseded_item_by_history
+        self, admin_client, shared_admin_list_with_one_superseded_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_superseded_item_by_history
+            shared_admin_list_with_one_superseded_item_by_history
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_read_mode_cannot_resolve_unreleased_item_by_history(
-        self, admin_client, new_admin_list_with_one_unreleased_item_by_history
+        self, admin_client, shared_admin_list_with_one_unreleased_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_unreleased_item_by_history,
+            shared_admin_list_with_one_unreleased_item_by_history,
             read_mode=True,
         )
         self.check_unresolved_record(record_list_items)
 
     def test_admin_user_read_mode_can_resolve_released_item_by_history(
-        self, admin_client, new_admin_list_with_one_released_item_by_history
+        self, admin_client, shared_admin_list_with_one_released_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_released_item_by_history,
+            shared_admin_list_with_one_released_item_by_history,
             read_mode=True,
         )
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_read_mode_can_resolve_draft_superseded_item_by_history(
-        self, admin_client, new_admin_list_with_one_draft_superseded_item_by_history
+        self, admin_client, shared_admin_list_with_one_draft_superseded_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseded_item_by_history,
+            shared_admin_list_with_one_draft_superseded_item_by_history,
             read_mode=True,
         )
         # Falls back to v1
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_read_mode_cannot_resolve_draft_superseding_item_by_history(
-        self, admin_client, new_admin_list_with_one_draft_superseding_item_by_history
+        self, admin_client, shared_admin_list_with_one_draft_superseding_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_draft_superseding_item_by_history,
+            shared_admin_list_with_one_draft_superseding_item_by_history,
             read_mode=True,
         )
         # Resolves v1
         self.check_resolved_record(record_list_items)
 
     def test_admin_user_read_mode_can_resolve_superseded_item_by_history(
-        self, admin_client, new_admin_list_with_one_superseded_item_by_history
+        self, admin_client, shared_admin_list_with_one_superseded_item_by_history
     ):
         record_list_items = admin_client.get_resolvable_list_items(
-            new_admin_list_with_one_superseded_item_by_history,
+            shared_admin_list_with_one_superseded_item_by_history,
             read_mode=True,
         )
         self.check_resolved_record(record_list_items)
 
     def test_read_user_cannot_resolve_unreleased_item_by_history(
-        self, basic_client, new_basic_list_with_one_unreleased_item_by_history
+        self, basic_client, shared_basic_list_with_one_unreleased_item_by_history
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_unreleased_item_by_history,
+            shared_basic_list_with_one_unreleased_item_by_history,
         )
         self.check_unresolved_record(record_list_items)
 
     def test_read_user_can_resolve_released_item_by_history(
-        self, basic_client, new_basic_list_with_one_released_item_by_history
+        self, basic_client, shared_basic_list_with_one_released_item_by_history
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_released_item_by_history,
+            shared_basic_list_with_one_released_item_by_history,
         )
         self.check_resolved_record(record_list_items)
 
     def test_read_user_can_resolve_draft_superseded_item_by_history(
-        self, basic_client, new_basic_list_with_one_draft_superseded_item_by_history
+        self, basic_client, shared_basic_list_with_one_draft_superseded_item_by_history
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_draft_superseded_item_by_history,
+            shared_basic_list_with_one_draft_superseded_item_by_history,
         )
         # Falls back to v1
         self.check_resolved_record(record_list_items)
 
     def test_read_user_cannot_resolve_draft_superseding_item_by_history(
-        self, basic_client, new_basic_list_with_one_draft_superseding_item_by_history
+        self, basic_client, shared_basic_list_with_one_draft_superseding_item_by_history
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_draft_superseding_item_by_history,
+            shared_basic_list_with_one_draft_superseding_item_by_history,
         )
         # Resolves v1
         self.check_resolved_record(record_list_items)
 
     def test_read_user_can_resolve_superseded_item_by_history(
-        self, basic_client, new_basic_list_with_one_superseded_item_by_history
+        self, basic_client, shared_basic_list_with_one_superseded_item_by_history
     ):
         record_list_items = basic_client.get_resolvable_list_items(
-            new_basic_list_with_one_superseded_item_by_history,
+            shared_basic_list_with_one_superseded_item_by_history,
         )
         self.check_resolved_record(record_list_items)
 
@@ -470,7 +470,7 @@ def test_create_minimal_list(admin_client, cleanup_admin, list_name):
     assert isinstance(record_list.identifier, str)
 
 
-@pytest.mark.parametrize("new_list", [{"cleanup": False}], indirect=True)
+@pytest.mark.parametrize("list_cleanup", [False], indirect=True)
 def test_delete_list(admin_client, new_list, list_name):
     admin_client.delete_list(new_list)
 
@@ -46,6 +46,7 @@ from ansys.grantami.recordlists import (
     UserOrGroup,
     UserRole,
 )
+from ansys.grantami.recordlists._models import _USER_ROLE_TO_MODEL
 
 
 class TestRecordList:
@@ -169,6 +170,24 @@ class TestUserOrGroup:
         assert user.name == self.username
         assert user.display_name == self.display_name
 
+    def test_identical_dtos_share_instance(self):
+        other_dto_user = GsaListsUserOrGroup(
+            identifier=self.user_id, display_name=self.display_name, name=self.username
+        )
+        assert UserOrGroup._from_model(self.dto_user) is UserOrGroup._from_model(other_dto_user)
+
+    def test_different_dtos_do_not_share_instance(self):
+        renamed_dto_user = GsaListsUserOrGroup(
+            identifier=self.user_id, display_name="domain\\renamed", name=self.username
+        )
+        user = UserOrGroup._from_model(self.dto_user)
+        renamed_user = UserOrGroup._from_model(renamed_dto_user)
+        assert user is not renamed_user
+        assert renamed_user.display_name == "domain\\renamed"
+
+    def test_missing_user_dto_mapping(self):
+        assert UserOrGroup._from_model(None) is None
+
     def test_repr(self):
         user = UserOrGroup._from_model(self.dto_user)
         assert repr(user) == "<UserOrGroup display_name: domain\\displayname>"
@@ -188,6 +207,13 @@ class TestUserOrGroup:
         user_2._identifier = identifier
         assert user_1 == user_2
 
+    def test_equal_users_have_equal_hashes(self):
+        identifier = str(uuid.uuid4())
+        user_1 = UserOrGroup(identifier=identifier, display_name="domain\\user")
+        user_2 = UserOrGroup(identifier=identifier, display_name="domain\\renamed")
+        assert hash(user_1) == hash(user_2)
+        assert len({user_1, user_2}) == 1
+
 
 class TestRecordListItem:
     def test_record_list_item_from_dto_mapping_list_item(self):
@@ -213,15 +239,41 @@ class TestRecordListItem:
         assert item.record_version == record_version
         assert item.record_guid == record_guid
 
+    def test_record_list_items_from_dto_share_database_and_table_guids(self):
+        dto_items = [
+            GsaListItem(
+                database_guid="".join(["e595fe23-b450-4d18-8c08-", "4a0f378ef095"]),
+                table_guid="".join(["81dff531-0254-4fbe-9621-", "174b10aaee3d"]),
+                record_history_guid=str(uuid.uuid4()),
+            )
+            for _ in range(2)
+        ]
+        assert dto_items[0].database_guid is not dto_items[1].database_guid
+
+        item_1, item_2 = [RecordListItem._from_model(dto_item) for dto_item in dto_items]
+
+        assert item_1.database_guid is item_2.database_guid
+        assert item_1.table_guid is item_2.table_guid
+
     @pytest.mark.parametrize(
-        "serialization_method",
+        ["serialize", "includes_table_guid"],
         [
-            "_to_create_list_item_model",
-            "_to_delete_list_item_model",
-            "_to_contains_search_item_model",
+            pytest.param(
+                lambda item: RecordListItem._to_create_list_item_models([item])[0],
+                True,
+                id="create",
+            ),
+            pytest.param(
+                lambda item: RecordListItem._to_delete_list_item_models([item])[0],
+                False,
+                id="delete",
+            ),
+            pytest.param(
+                lambda item: item._to_contains_search_item_model(), False, id="contains_search"
+            ),
         ],
     )
-    def test_record_list_item_to_dto_mapping(self, serialization_method):
+    def test_record_list_item_to_dto_mapping(self, serialize, includes_table_guid):
         item = RecordListItem(
             database_guid=str(uuid.uuid4()),
             table_guid=str(uuid.uuid4()),
@@ -230,13 +282,52 @@ class TestRecordListItem:
         )
         item._record_guid = str(uuid.uuid4())
 
-        dto = getattr(item, serialization_method)()
+        dto = serialize(item)
         assert dto.database_guid == item.database_guid
-        if serialization_method == "_to_create_list_item_model":
+        if includes_table_guid:
             assert dto.table_guid == item.table_guid
         assert dto.record_history_guid == item.record_history_guid
         assert dto.record_version == item.record_version
 
+    def test_record_list_items_to_create_dtos_mapping(self):
+        items = [
+            RecordListItem(
+                database_guid=str(uuid.uuid4()),
+                table_guid=str(uuid.uuid4()),
+                record_history_guid=str(uuid.uuid4()),
+                record_version=record_version,
+            )
+            for record_version in [None, 2]
+        ]
+
+        dtos = RecordListItem._to_create_list_item_models(items)
+
+        assert len(dtos) == len(items)
+        for dto, item in zip(dtos, items):
+            assert dto.database_guid == item.database_guid
+            assert dto.table_guid == item.table_guid
+            assert dto.record_history_guid == item.record_history_guid
+            assert dto.record_version == item.record_version
+
+    def test_record_list_items_to_delete_dtos_mapping(self):
+        items = [
+            RecordListItem(
+                database_guid=str(uuid.uuid4()),
+                table_guid=str(uuid.uuid4()),
+                record_history_guid=str(uuid.uuid4()),
+                record_version=record_version,
+            )
+            for record_version in [None, 2]
+        ]
+
+        dtos = RecordListItem._to_delete_list_item_models(items)
+
+        assert len(dtos) == len(items)
+        for dto, item in zip(dtos, items):
+            assert dto.database_guid == item.database_guid
+            assert dto.record_history_guid == item.record_history_guid
+            assert dto.record_version == item.record_version
+
     def test_record_list_item_repr(self):
         item = RecordListItem(
             database_guid="b0de1566-c2c5-49ac-a8d1-e6183b1a3b77",
@@ -282,6 +373,19 @@ class TestItemEquality:
     def test_item_equality(self, item_a, item_b, expected_equal):
         assert (item_a == item_b) is expected_equal
 
+    def test_equal_items_have_equal_hashes(self):
+        item_a = RecordListItem(self.DB1, self.T1, self.RHG1, self.RV1)
+        item_b = RecordListItem(self.DB1, self.T1, self.RHG1, self.RV1)
+        assert hash(item_a) == hash(item_b)
+
+    def test_items_can_be_deduplicated_with_a_set(self):
+        items = [
+            RecordListItem(self.DB1, self.T1, self.RHG1),
+            RecordListItem(self.DB1, self.T1, self.RHG1),
+            RecordListItem(self.DB1, self.T1, self.RHG1, self.RV1),
+        ]
+        assert len(set(items)) == 2
+
     def test_item_equality_with_other_type(self):
         item = RecordListItem(self.DB1, self.T1, self.RHG1)
         assert (item == 2) is False
@@ -463,3 +567,16 @@ def test_enum_mapping():
     # Check that all enum members exist in the autogenerated enum, and that they have the same name and value.
     for member in UserRole:
         assert member.value == GsaUserRole[member.name].value
+
+
+def test_enum_to_model_mapping():
+    # Check that the precomputed mapping covers all enum members and targets the matching member.
+    assert set(_USER_ROLE_TO_MODEL) == set(UserRole)
+    for member, model_member in _USER_ROLE_TO_MODEL.items():
+        assert model_member is GsaUserRole[member.name]
+
+
+@pytest.mark.parametrize("cls", [RecordList, RecordListItem, UserOrGroup, SearchResult])
+def test_models_do_not_have_instance_dict(cls):
+    # Instances are created in bulk when parsing API responses, so they use __slots__.
+    assert "__dict__" not in dir(cls)